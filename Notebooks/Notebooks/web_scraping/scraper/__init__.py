@@ -0,0 +1,5 @@
+"""Config-driven crawl -> extract -> ingest -> index -> query pipeline.
+
+Kept import-light: submodules pull in their heavy dependencies themselves and
+the CLI only imports the one a subcommand needs.
+"""
@@ -0,0 +1,80 @@
+"""A small persistent Bloom filter used as the per-site "already crawled" set."""
+import hashlib
+import math
+import os
+import struct
+
+_MAGIC = b"BLM1"
+_HEADER = struct.Struct("<4sQQQd")   # magic, capacity, bits, count, error_rate
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    Membership costs ``k`` bit lookups regardless of how many URLs were added,
+    and memory is ``bits / 8`` bytes. False positives happen at roughly
+    ``error_rate`` until ``count`` passes ``capacity``.
+    """
+
+    def __init__(self, capacity=100_000, error_rate=1e-4):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.nbits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.k = max(1, round(self.nbits / capacity * math.log(2)))
+        self.bits = bytearray((self.nbits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.nbits for i in range(self.k)]
+
+    def __contains__(self, item):
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def add(self, item):
+        """Add ``item``; return False if it was (probably) already present."""
+        new = False
+        for p in self._positions(item):
+            byte, mask = p >> 3, 1 << (p & 7)
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def full(self):
+        return self.count > self.capacity
+
+    def save(self, path):
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.capacity, self.nbits, self.count, self.error_rate))
+            f.write(self.bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a filter written by ``save``; raise ValueError if the file is not intact."""
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise ValueError(f"{path} is truncated")
+            magic, capacity, nbits, count, error_rate = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a Bloom filter file")
+            bloom = cls(capacity, error_rate)
+            if bloom.nbits != nbits:
+                raise ValueError(f"{path} was written with a different bit layout")
+            bits = f.read()
+            if len(bits) != len(bloom.bits):
+                raise ValueError(f"{path} is truncated")
+            bloom.bits = bytearray(bits)
+            bloom.count = count
+        return bloom
@@ -0,0 +1,123 @@
+"""Single entry point for the scraping and retrieval pipeline.
+
+    python -m scraper crawl [SITE ...]
+    python -m scraper extract [SITE ...]
+    python -m scraper ingest [SITE ...]
+    python -m scraper index
+    python -m scraper query "how to style a lungi dress"
+    python -m scraper bench
+
+Heavy dependencies (Playwright, BeautifulSoup, reportlab, sentence-transformers,
+chromadb) are imported inside the subcommand that needs them, so ``query``
+and ``bench`` never load the browser or PDF stack.
+"""
+import argparse
+import os
+
+from .config import SITES_DIR, load_sites
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+OUTPUTS_DIR = os.path.normpath(os.path.join(_HERE, "..", "..", "..", "outputs"))
+DATASET_CSV = os.path.join(OUTPUTS_DIR, "scraped_dataset.csv")
+CHUNKS_CSV = os.path.join(OUTPUTS_DIR, "chunked_dataset.csv")
+# Not the notebook's retrieval_index_meta.json: that one points at Colab paths.
+META_PATH = os.path.join(OUTPUTS_DIR, "scraper_index_meta.json")
+BENCH_QUERIES = [
+    "How to style a lungi dress for a festival",
+    "sustainable fast fashion in Sri Lanka",
+    "saree draping tips for a wedding",
+    "what to wear for a weekend brunch",
+]
+
+
+def cmd_crawl(args):
+    from .crawl import run_crawl
+    run_crawl(load_sites(args.sites, args.sites_dir))
+
+
+def cmd_extract(args):
+    from .extract import extract_site
+    for site in load_sites(args.sites, args.sites_dir):
+        extract_site(site)
+
+
+def cmd_ingest(args):
+    from .ingest import run_ingest
+    run_ingest(load_sites(args.sites, args.sites_dir), args.dataset, args.chunks,
+               args.chunk_size, args.overlap)
+
+
+def cmd_index(args):
+    from .retrieval import build_index
+    build_index(args.chunks, args.chroma_dir, args.meta)
+
+
+def cmd_query(args):
+    from .retrieval import run_query
+    run_query(args.meta, args.query, mode=args.mode, k=args.k, rerank=args.rerank)
+
+
+def cmd_bench(args):
+    from .retrieval import run_bench
+    run_bench(args.meta, args.queries or BENCH_QUERIES, modes=args.modes,
+              repeats=args.repeats, k=args.k, rerank=args.rerank)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="scraper", description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def with_sites(p):
+        p.add_argument("sites", nargs="*", help="site names or config paths (default: every site)")
+        p.add_argument("--sites-dir", default=SITES_DIR)
+        return p
+
+    with_sites(sub.add_parser("crawl", help="fetch article HTML for the given sites concurrently")) \
+        .set_defaults(func=cmd_crawl)
+    with_sites(sub.add_parser("extract", help="turn crawled HTML into PDFs and articles.jsonl")) \
+        .set_defaults(func=cmd_extract)
+
+    p = with_sites(sub.add_parser("ingest", help="build the dataset and chunk CSVs"))
+    p.add_argument("--dataset", default=DATASET_CSV)
+    p.add_argument("--chunks", default=CHUNKS_CSV)
+    p.add_argument("--chunk-size", type=int, default=500)
+    p.add_argument("--overlap", type=int, default=50)
+    p.set_defaults(func=cmd_ingest)
+
+    p = sub.add_parser("index", help="embed chunks into Chroma and write the index metadata")
+    p.add_argument("--chunks", default=CHUNKS_CSV)
+    p.add_argument("--chroma-dir", default=os.path.join(OUTPUTS_DIR, "chroma_db"))
+    p.add_argument("--meta", default=META_PATH)
+    p.set_defaults(func=cmd_index)
+
+    p = sub.add_parser("query", help="run one query against the index")
+    p.add_argument("query")
+    p.add_argument("--mode", choices=["dense", "sparse", "hybrid"], default="hybrid")
+    p.add_argument("-k", type=int, default=None)
+    p.add_argument("--rerank", action="store_true")
+    p.add_argument("--meta", default=META_PATH)
+    p.set_defaults(func=cmd_query)
+
+    p = sub.add_parser("bench", help="measure retrieval latency per mode")
+    p.add_argument("queries", nargs="*")
+    p.add_argument("--modes", nargs="+", choices=["dense", "sparse", "hybrid"],
+                   default=["dense", "sparse", "hybrid"])
+    p.add_argument("--repeats", type=int, default=5)
+    p.add_argument("-k", type=int, default=None)
+    p.add_argument("--rerank", action="store_true")
+    p.add_argument("--meta", default=META_PATH)
+    p.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "ingest" and not 0 <= args.overlap < args.chunk_size:
+        parser.error("--overlap must be >= 0 and smaller than --chunk-size")
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
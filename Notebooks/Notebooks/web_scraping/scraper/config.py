@@ -0,0 +1,113 @@
+"""Per-site crawl configuration.
+
+Each site lives in its own JSON file under ``sites/``. Anything a file leaves
+out is taken from ``DEFAULTS`` so a config only has to spell out what is
+different about that site. This module is stdlib-only on purpose: the CLI
+imports it for every subcommand.
+"""
+import copy
+import glob
+import json
+import os
+
+SITES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sites")
+
+DEFAULTS = {
+    "name": None,
+    "out_dir": None,
+    "file_prefix": None,
+    "delay_secs": 1.0,
+    "concurrency": 1,
+    # render=False fetches articles over the shared HTTP pool instead of the browser
+    "render": True,
+    "goto": {
+        "timeout_ms": 120000,
+        "wait_until": "domcontentloaded",
+        "settle_secs": 2.0,
+        "scroll_steps": 0,
+        "scroll_pause": 0.8,
+    },
+    "listing": {
+        "urls": [],
+        "link_selector": "a[href]",
+        "page_url": None,   # e.g. "{url}?page={n}"; None means only the listing urls
+        "max_pages": 1,     # null: until pagination runs dry (still capped by max_listing_pages)
+        "goto": {"scroll_steps": 0},   # overrides of the article goto settings for listing pages
+    },
+    "discovery": {
+        "robots": True,     # take sitemap locations from robots.txt when it lists any
+        "sitemaps": ["{origin}/sitemap.xml"],
+        "sitemap_include": [],   # only follow index entries containing one of these
+        "feeds": ["{origin}/feed/"],
+        "fetch_concurrency": 4,
+        "lookahead": 4,     # listing pages rendered concurrently per window
+        "max_listing_pages": 200,   # hard cap per listing url
+    },
+    "articles": [],
+    # include/exclude are regexes searched in the canonical path + query
+    "links": {
+        "hosts": [],        # allowed hosts; a bare/www. variant is rewritten to the listed one
+        "https": True,
+        "trailing_slash": "strip",   # "strip", "add" or "keep"
+        "strip_params": [],  # on top of links.TRACKING_PARAMS
+        "include": [],
+        "exclude": [],
+    },
+    "extract": {
+        "strip_tags": [],
+        "title_selectors": ["h1", "h2"],
+        "content_selectors": ["div.entry-content", "article"],
+        "min_content_len": 0,
+        "fallback": None,   # "largest", "body" or None
+        "remove_tags": ["script", "style", "aside", "figure", "iframe", "noscript"],
+        "remove_selectors": [],
+        "block_tags": ["p"],
+        "fallback_block_tag": None,
+        "fallback_block_len": 60,
+        "min_block_len": 1,
+        "skip_first_pattern": None,
+        "skip_block_pattern": None,
+        "skip_pattern_min_len": 0,   # shorter blocks are kept without the skip_block_pattern check
+        "cut_patterns": [],       # applied in order, before whitespace is collapsed
+        "collapse_pattern": r"\s+",
+        "min_text_len": 50,
+    },
+}
+
+
+def _merge(base, override):
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_site(path):
+    """Load one site config, filling unset keys from ``DEFAULTS``."""
+    with open(path, encoding="utf-8") as f:
+        site = _merge(DEFAULTS, json.load(f))
+    if not site["name"]:
+        site["name"] = os.path.splitext(os.path.basename(path))[0]
+    site["out_dir"] = site["out_dir"] or f"{site['name']}_articles"
+    site["file_prefix"] = site["file_prefix"] or f"{site['name']}_article"
+    return site
+
+
+def site_paths(names=None, sites_dir=SITES_DIR):
+    """Resolve site names or paths to config files; no names means every site."""
+    if not names:
+        return sorted(glob.glob(os.path.join(sites_dir, "*.json")))
+    paths = []
+    for name in names:
+        path = name if name.endswith(".json") else os.path.join(sites_dir, f"{name}.json")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No site config for '{name}' ({path})")
+        paths.append(path)
+    return paths
+
+
+def load_sites(names=None, sites_dir=SITES_DIR):
+    return [load_site(p) for p in site_paths(names, sites_dir)]
@@ -0,0 +1,151 @@
+"""Fetch article HTML for one or more sites in a single process.
+
+All sites share one Chromium instance and one Playwright HTTP request
+context; each site gets its own browser context and a semaphore sized by its
+``concurrency`` setting. Raw HTML is written to ``<out_dir>/html/`` and
+listed in ``<out_dir>/crawl.jsonl`` so ``extract`` can run separately.
+Fetched URLs are also added to ``<out_dir>/seen.bloom``, a persistent Bloom
+filter that discovery consults so a re-run skips them without loading the
+manifest into memory. A URL only goes into the seen-set once it is fetched:
+everything discovered is first written to ``<out_dir>/todo.jsonl``, and the
+next run drains that file before discovering more, so an interrupted crawl
+or failed fetches are picked up again (up to ``MAX_ATTEMPTS`` tries).
+"""
+import asyncio
+import hashlib
+import json
+import os
+
+from .bloom import BloomFilter
+from .discover import discover_links
+from .fetch import fetch_html
+from .links import canonicalize
+
+SEEN_CAPACITY = 100_000
+MAX_ATTEMPTS = 3
+
+
+def load_seen(out_dir, manifest_path, links_cfg):
+    """Load the site's seen-set, rebuilding it from the manifest if missing, damaged or full."""
+    bloom_path = os.path.join(out_dir, "seen.bloom")
+    capacity = SEEN_CAPACITY
+    if os.path.exists(bloom_path):
+        try:
+            seen = BloomFilter.load(bloom_path)
+        except ValueError as e:
+            print(f"⚠️ {e}; rebuilding from {manifest_path}.")
+        else:
+            if not seen.full:
+                return seen
+            capacity = seen.capacity * 2
+
+    seen = BloomFilter(capacity)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    seen.add(canonicalize(json.loads(line)["url"], cfg=links_cfg) or "")
+    seen.save(bloom_path)
+    return seen
+
+
+def load_todo(path, seen):
+    """URLs discovered on earlier runs that still need fetching, with their attempt counts."""
+    todo = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    if entry["url"] not in seen:
+                        todo[entry["url"]] = entry["attempts"]
+    return todo
+
+
+def save_todo(path, todo):
+    if not todo:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        for url, attempts in todo.items():
+            f.write(json.dumps({"url": url, "attempts": attempts}) + "\n")
+    os.replace(tmp, path)
+
+
+async def crawl_site(browser, http, site):
+    html_dir = os.path.join(site["out_dir"], "html")
+    os.makedirs(html_dir, exist_ok=True)
+    manifest_path = os.path.join(site["out_dir"], "crawl.jsonl")
+    seen = load_seen(site["out_dir"], manifest_path, site["links"])
+    todo_path = os.path.join(site["out_dir"], "todo.jsonl")
+    todo = load_todo(todo_path, seen)
+
+    context = await browser.new_context()
+    try:
+        for link in await discover_links(context, http, site, seen, pending=todo):
+            todo[link] = 0
+        save_todo(todo_path, todo)
+        print(f"[{site['name']}] {len(todo)} articles to fetch ({len(seen)} already fetched).")
+
+        sem = asyncio.Semaphore(site["concurrency"])
+        fetched = 0
+
+        async def fetch_one(link, manifest):
+            nonlocal fetched
+            async with sem:
+                print(f"[{site['name']}] ➡️ Visiting article: {link}")
+                try:
+                    html = await fetch_html(context, http, link, site)
+                except Exception as e:
+                    todo[link] += 1
+                    if todo[link] >= MAX_ATTEMPTS:
+                        del todo[link]
+                        print(f"[{site['name']}] ❌ Giving up on {link}: {e}")
+                    else:
+                        print(f"[{site['name']}] ❌ Error loading article (will retry next run): {e}")
+                    return
+                name = hashlib.sha1(link.encode("utf-8")).hexdigest()[:16] + ".html"
+                with open(os.path.join(html_dir, name), "w", encoding="utf-8") as f:
+                    f.write(html)
+                manifest.write(json.dumps({"url": link, "html": os.path.join("html", name)}) + "\n")
+                manifest.flush()
+                seen.add(link)
+                del todo[link]
+                fetched += 1
+                await asyncio.sleep(site["delay_secs"])
+
+        with open(manifest_path, "a", encoding="utf-8") as manifest:
+            await asyncio.gather(*(fetch_one(l, manifest) for l in list(todo)))
+    finally:
+        await context.close()
+        seen.save(os.path.join(site["out_dir"], "seen.bloom"))
+        save_todo(todo_path, todo)
+
+    print(f"[{site['name']}] ✅ Done. {fetched} pages saved in '{html_dir}'.")
+    return fetched
+
+
+async def crawl_sites(sites):
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        http = await p.request.new_context()
+        try:
+            results = await asyncio.gather(
+                *(crawl_site(browser, http, site) for site in sites), return_exceptions=True
+            )
+        finally:
+            await http.dispose()
+            await browser.close()
+
+    for site, result in zip(sites, results):
+        if isinstance(result, Exception):
+            print(f"[{site['name']}] ❌ Crawl failed: {result}")
+    return results
+
+
+def run_crawl(sites):
+    return asyncio.run(crawl_sites(sites))
@@ -0,0 +1,248 @@
+"""Article discovery: sitemaps and feeds first, listing pagination as a fallback.
+
+Sitemaps (found via robots.txt or the configured locations) and RSS/Atom
+feeds are fetched over the shared HTTP request context and parsed
+incrementally, dropping each entry once read, so a large sitemap never
+becomes a full element tree. Only when no sitemap yields an article do we
+render listing pages, ``lookahead`` pages at a time. Pagination stops at the
+first window that adds no unseen URL, at a page with no matching links or
+the same links as the page before, and in any case after
+``max_listing_pages``.
+Every link goes through the site's ``LinkFilter``. URLs already crawled (the
+persistent seen-set) or still waiting in the site's todo file count as known,
+so a re-run stops as soon as it reaches old articles and discovery cost
+follows the number of new articles rather than the size of the site.
+"""
+import asyncio
+import time
+import xml.etree.ElementTree as ET
+import zlib
+from urllib.parse import urlsplit
+
+from .fetch import render_page
+from .links import LinkFilter
+
+FEED_CHUNK = 64 * 1024
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _chunks(body):
+    if body[:2] == b"\x1f\x8b":
+        d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        for i in range(0, len(body), FEED_CHUNK):
+            yield d.decompress(body[i:i + FEED_CHUNK])
+        yield d.flush()
+    else:
+        for i in range(0, len(body), FEED_CHUNK):
+            yield body[i:i + FEED_CHUNK]
+
+
+def iter_xml_links(body):
+    """Yield ``(kind, url)`` from a sitemap, sitemap index, RSS or Atom document.
+
+    ``kind`` is ``"sitemap"`` for entries of a sitemap index and ``"page"``
+    otherwise. Entries are removed from the tree as soon as they are read, and
+    empty locations are skipped.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack = []
+
+    def links_of(tag, elem):
+        for child in elem:
+            ctag = _local(child.tag)
+            if tag in ("url", "sitemap") and ctag == "loc":
+                yield ("sitemap" if tag == "sitemap" else "page"), (child.text or "").strip()
+            elif tag == "item" and ctag == "link":
+                yield "page", (child.text or "").strip()
+            elif tag == "entry" and ctag == "link" and child.get("rel", "alternate") == "alternate":
+                yield "page", child.get("href", "").strip()
+
+    def drain():
+        for event, elem in parser.read_events():
+            if event == "start":
+                stack.append(elem)
+                continue
+            stack.pop()
+            tag = _local(elem.tag)
+            if tag in ("url", "sitemap", "item", "entry"):
+                yield from ((kind, url) for kind, url in links_of(tag, elem) if url)
+                # Detach the entry so the tree stays as small as one entry.
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+
+    try:
+        for chunk in _chunks(body):
+            parser.feed(chunk)
+            yield from drain()
+        parser.close()
+        yield from drain()
+    except (ET.ParseError, zlib.error):
+        return
+
+
+async def _get(http, url, timeout_ms):
+    try:
+        resp = await http.get(url, timeout=timeout_ms, fail_on_status_code=False)
+    except Exception:
+        return None
+    if not resp.ok:
+        return None
+    return await resp.body()
+
+
+def _origin(site):
+    """Origin to harvest sitemaps/feeds from; sites with only seed articles have none."""
+    for url in site["listing"]["urls"]:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+    return None
+
+
+async def _robots_sitemaps(http, origin, timeout_ms):
+    body = await _get(http, f"{origin}/robots.txt", timeout_ms)
+    if not body:
+        return []
+    sitemaps = []
+    for line in body.decode("utf-8", "replace").splitlines():
+        key, _, value = line.partition(":")
+        if key.strip().lower() == "sitemap" and value.strip():
+            sitemaps.append(value.strip())
+    return sitemaps
+
+
+def _wanted_sitemap(url, cfg):
+    return not cfg["sitemap_include"] or any(s in url for s in cfg["sitemap_include"])
+
+
+async def harvest_sitemaps(http, site, origin):
+    """Walk sitemap indexes breadth-first, fetching each level concurrently.
+
+    Top-level sitemaps (from robots.txt or the config) are always read so
+    indexes among them are followed. Index entries are only followed, and page
+    URLs only kept, for sitemaps matching ``sitemap_include``.
+    """
+    cfg = site["discovery"]
+    timeout_ms = site["goto"]["timeout_ms"]
+    level = await _robots_sitemaps(http, origin, timeout_ms) if cfg["robots"] else []
+    level = level or [s.format(origin=origin) for s in cfg["sitemaps"]]
+
+    sem = asyncio.Semaphore(cfg["fetch_concurrency"])
+    visited, pages = set(), []
+
+    async def fetch(url):
+        async with sem:
+            return await _get(http, url, timeout_ms)
+
+    while level:
+        level = [u for u in dict.fromkeys(level) if u not in visited]
+        visited.update(level)
+        bodies = await asyncio.gather(*(fetch(u) for u in level))
+        children = []
+        for sitemap_url, body in zip(level, bodies):
+            if not body:
+                continue
+            keep_pages = _wanted_sitemap(sitemap_url, cfg)
+            for kind, url in iter_xml_links(body):
+                if kind == "page":
+                    if keep_pages:
+                        pages.append(url)
+                elif _wanted_sitemap(url, cfg):
+                    children.append(url)
+        level = children
+    return pages
+
+
+async def harvest_feeds(http, site, origin):
+    timeout_ms = site["goto"]["timeout_ms"]
+    feeds = [f.format(origin=origin) for f in site["discovery"]["feeds"]]
+    bodies = await asyncio.gather(*(_get(http, f, timeout_ms) for f in feeds))
+    return [url for body in bodies if body for _, url in iter_xml_links(body)]
+
+
+async def _listing_links(context, url, site):
+    goto = {**site["goto"], **site["listing"]["goto"]}
+    try:
+        page, _ = await render_page(context, url, goto)
+        try:
+            return await page.eval_on_selector_all(
+                site["listing"]["link_selector"], "elements => elements.map(el => el.href)"
+            )
+        finally:
+            await page.close()
+    except Exception as e:
+        print(f"[{site['name']}] ❌ Error loading listing {url}: {e}")
+        return []
+
+
+async def paginate_listing(context, site, link_filter):
+    """Render listing pages in windows of ``lookahead`` and collect new article links.
+
+    A listing stops at the first window that adds no new URL, at a page with
+    no matching links or with the same links as the page before it (past the
+    last real page), and never renders more than ``max_listing_pages``.
+    """
+    listing = site["listing"]
+    cap = site["discovery"]["max_listing_pages"]
+    if listing["page_url"]:
+        window = max(1, site["discovery"]["lookahead"])
+        max_pages = min(listing["max_pages"] or cap, cap)
+    else:
+        window, max_pages = 1, 1
+
+    links = []
+    for base in listing["urls"]:
+        n, previous, done = 1, None, False
+        while not done and n <= max_pages:
+            last = min(n + window - 1, max_pages)
+            urls = [listing["page_url"].format(url=base, n=i) if i > 1 else base for i in range(n, last + 1)]
+            print(f"[{site['name']}] 🌐 Visiting listing pages {n}-{last}")
+            results = await asyncio.gather(*(_listing_links(context, u, site) for u in urls))
+
+            new = []
+            for i, (url, raw) in enumerate(zip(urls, results), start=n):
+                raw_set = set(raw)
+                passed = link_filter.passed
+                new.extend(l for l in (link_filter.admit(href, url) for href in raw) if l)
+                if link_filter.passed == passed or raw_set == previous:
+                    print(f"[{site['name']}] 🚫 Listing page {i} has no new article links. Stopping pagination.")
+                    done = True
+                    break
+                previous = raw_set
+            links.extend(new)
+            if not new and not done:
+                print(f"[{site['name']}] 🚫 No new articles in pages {n}-{last}. Stopping pagination.")
+                done = True
+            n = last + 1
+    return links
+
+
+async def discover_links(context, http, site, seen, pending=()):
+    """Return canonical article URLs for ``site`` that are neither in ``seen`` nor ``pending``."""
+    t0 = time.time()
+    link_filter = LinkFilter(site["links"], seen, pending)
+
+    links = [l for l in (link_filter.admit(seed) for seed in site["articles"]) if l]
+
+    origin = _origin(site)
+    sitemap_ok = False
+    if origin:
+        sitemap_raw, feed_raw = await asyncio.gather(
+            harvest_sitemaps(http, site, origin), harvest_feeds(http, site, origin)
+        )
+        passed = link_filter.passed
+        links.extend(l for l in (link_filter.admit(href, origin) for href in sitemap_raw) if l)
+        sitemap_ok = link_filter.passed > passed
+        links.extend(l for l in (link_filter.admit(href, origin) for href in feed_raw) if l)
+
+    source = "sitemaps/feeds"
+    if not sitemap_ok and site["listing"]["urls"]:
+        source = "feeds/listing"
+        links.extend(await paginate_listing(context, site, link_filter))
+
+    print(f"[{site['name']}] Discovered {len(links)} new articles via {source} "
+          f"in {time.time() - t0:.1f}s. Rejected links: {link_filter.summary()}.")
+    return links
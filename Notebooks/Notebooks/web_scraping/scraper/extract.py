@@ -0,0 +1,129 @@
+"""Config-driven article extraction (HTML -> title, body text).
+
+This generalises the ``extract_article_parts`` copies in the standalone
+scripts; the per-site differences are described by the ``extract`` block of
+the site config.
+"""
+import json
+import os
+import re
+
+from bs4 import BeautifulSoup
+
+from .pdf import save_text_to_pdf
+
+
+def _pick_article(soup, cfg):
+    for sel in cfg["content_selectors"]:
+        article = soup.select_one(sel)
+        if article and len(article.get_text(strip=True)) > cfg["min_content_len"]:
+            return article
+
+    if cfg["fallback"] == "body":
+        # Like the original hi.lk loop: the last selector's match wins even if short.
+        last = soup.select_one(cfg["content_selectors"][-1]) if cfg["content_selectors"] else None
+        return last or soup.find("body")
+    if cfg["fallback"] == "largest":
+        best, best_len = None, 0
+        for c in soup.find_all(["div", "article", "section"], recursive=True):
+            txt = c.get_text(" ", strip=True)
+            if len(txt) > best_len:
+                best, best_len = c, len(txt)
+        return best
+    return None
+
+
+def extract_article_parts(html, cfg):
+    soup = BeautifulSoup(html, "html.parser")
+
+    for tag in soup(cfg["strip_tags"]):
+        tag.decompose()
+
+    title_tag = None
+    for sel in cfg["title_selectors"]:
+        title_tag = soup.select_one(sel)
+        if title_tag:
+            break
+    title = title_tag.get_text(strip=True) if title_tag else "Untitled Article"
+
+    article = _pick_article(soup, cfg)
+    if not article:
+        return title, ""
+
+    for tag in article.find_all(cfg["remove_tags"]):
+        tag.decompose()
+    if cfg["remove_selectors"]:
+        for tag in article.select(", ".join(cfg["remove_selectors"])):
+            tag.decompose()
+
+    skip_first = re.compile(cfg["skip_first_pattern"]) if cfg["skip_first_pattern"] else None
+    skip_block = re.compile(cfg["skip_block_pattern"]) if cfg["skip_block_pattern"] else None
+
+    parts = []
+    for idx, tag in enumerate(article.find_all(cfg["block_tags"], recursive=True)):
+        txt = tag.get_text(" ", strip=True)
+        if len(txt) < cfg["min_block_len"]:
+            continue
+        if idx == 0 and skip_first and skip_first.match(txt):
+            continue
+        if skip_block and len(txt) >= cfg["skip_pattern_min_len"] and skip_block.search(txt):
+            continue
+        parts.append(txt)
+
+    if not parts and cfg["fallback_block_tag"]:
+        parts = [t.get_text(" ", strip=True) for t in article.find_all(cfg["fallback_block_tag"])
+                 if len(t.get_text(strip=True)) > cfg["fallback_block_len"]]
+
+    text = "\n\n".join(parts)
+    for pattern in cfg["cut_patterns"]:
+        text = re.sub(pattern, "", text)
+    text = re.sub(cfg["collapse_pattern"], " ", text).strip()
+
+    if len(text) < cfg["min_text_len"]:
+        return title.strip(), ""
+    return title.strip(), text
+
+
+def extract_site(site):
+    """Turn the HTML saved by ``crawl`` into PDFs plus an ``articles.jsonl`` manifest."""
+    out_dir = site["out_dir"]
+    crawl_manifest = os.path.join(out_dir, "crawl.jsonl")
+    if not os.path.exists(crawl_manifest):
+        print(f"[{site['name']}] Nothing crawled yet ({crawl_manifest} missing).")
+        return 0
+
+    articles_path = os.path.join(out_dir, "articles.jsonl")
+    done = set()
+    if os.path.exists(articles_path):
+        with open(articles_path, encoding="utf-8") as f:
+            done = {json.loads(line)["url"] for line in f if line.strip()}
+
+    saved = len(done)
+    with open(crawl_manifest, encoding="utf-8") as f, open(articles_path, "a", encoding="utf-8") as out:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if entry["url"] in done:
+                continue
+            with open(os.path.join(out_dir, entry["html"]), encoding="utf-8") as h:
+                title, body = extract_article_parts(h.read(), site["extract"])
+            if not body:
+                print(f"[{site['name']}] ⚠️ Skipping (no usable content): {entry['url']}")
+                continue
+
+            saved += 1
+            safe_name = re.sub(r"[^\w\d\- ]+", "", title)[:60].strip().replace(" ", "_")
+            filename = f"{site['file_prefix']}_{saved}_{safe_name}.pdf"
+            try:
+                save_text_to_pdf(title, body, os.path.join(out_dir, filename))
+            except Exception as e:
+                print(f"[{site['name']}] ❌ Error saving PDF: {e}")
+                saved -= 1
+                continue
+            out.write(json.dumps({"url": entry["url"], "file_name": filename,
+                                  "title": title, "text": body}, ensure_ascii=False) + "\n")
+            done.add(entry["url"])
+            print(f"[{site['name']}] [{saved}] ✅ Saved PDF: {filename}")
+
+    return saved
@@ -0,0 +1,28 @@
+"""Page fetching shared by discovery and crawl."""
+import asyncio
+
+
+async def render_page(context, url, goto):
+    """Open ``url`` in a new tab of ``context``; the caller closes the returned page."""
+    page = await context.new_page()
+    try:
+        await page.goto(url, timeout=goto["timeout_ms"], wait_until=goto["wait_until"])
+        for _ in range(goto["scroll_steps"]):
+            await page.mouse.wheel(0, 2000)
+            await asyncio.sleep(goto["scroll_pause"])
+        await asyncio.sleep(goto["settle_secs"])
+        return page, await page.content()
+    except Exception:
+        await page.close()
+        raise
+
+
+async def fetch_html(context, http, url, site):
+    if not site["render"]:
+        resp = await http.get(url, timeout=site["goto"]["timeout_ms"])
+        if not resp.ok:
+            raise RuntimeError(f"HTTP {resp.status}")
+        return await resp.text()
+    page, html = await render_page(context, url, site["goto"])
+    await page.close()
+    return html
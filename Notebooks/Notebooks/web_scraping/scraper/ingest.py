@@ -0,0 +1,53 @@
+"""Collect extracted articles into the dataset and chunk CSVs used by the notebooks."""
+import csv
+import json
+import os
+
+CHUNK_SIZE = 500
+OVERLAP = 50
+
+
+def chunk_text(text, chunk_size=CHUNK_SIZE, overlap=OVERLAP):
+    if not 0 <= overlap < chunk_size:
+        raise ValueError("overlap must be >= 0 and smaller than chunk_size")
+    chunks = []
+    start = 0
+    while start < len(text):
+        chunks.append(text[start:start + chunk_size])
+        start += chunk_size - overlap
+    return chunks
+
+
+def run_ingest(sites, dataset_csv, chunks_csv, chunk_size=CHUNK_SIZE, overlap=OVERLAP):
+    os.makedirs(os.path.dirname(os.path.abspath(dataset_csv)), exist_ok=True)
+    os.makedirs(os.path.dirname(os.path.abspath(chunks_csv)), exist_ok=True)
+    n_docs = n_chunks = 0
+
+    with open(dataset_csv, "w", newline="", encoding="utf-8") as df, \
+         open(chunks_csv, "w", newline="", encoding="utf-8") as cf:
+        docs = csv.writer(df)
+        chunks = csv.writer(cf)
+        docs.writerow(["file_name", "text", "text_length"])
+        chunks.writerow(["file_name", "chunk_id", "chunk_text", "chunk_length"])
+
+        for site in sites:
+            path = os.path.join(site["out_dir"], "articles.jsonl")
+            if not os.path.exists(path):
+                print(f"[{site['name']}] No extracted articles ({path} missing).")
+                continue
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    art = json.loads(line)
+                    text = f"{art['title']}\n{art['text']}"
+                    docs.writerow([art["file_name"], text, len(text)])
+                    n_docs += 1
+                    for i, chunk in enumerate(chunk_text(text, chunk_size, overlap)):
+                        chunks.writerow([art["file_name"], i + 1, chunk, len(chunk)])
+                        n_chunks += 1
+
+    print(f"✅ Ingested {n_docs} articles into {n_chunks} chunks.")
+    print("Dataset:", dataset_csv)
+    print("Chunks:", chunks_csv)
+    return n_docs, n_chunks
@@ -0,0 +1,128 @@
+"""URL canonicalisation and the per-site link filter.
+
+Every link found during discovery goes through ``LinkFilter.admit``: it is
+resolved against the page it came from, canonicalised, checked against the
+site's compiled host / include / exclude rules and de-duplicated against
+both this run and the persistent seen-set. Rejections are counted by reason
+so a site config can be tuned from the crawl log.
+"""
+import re
+from collections import Counter
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "ref", "ref_src", "share", "amp",
+}
+TRACKING_PREFIXES = ("utm_",)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _compile(patterns):
+    return re.compile("|".join(f"(?:{p})" for p in patterns)) if patterns else None
+
+
+def canonicalize(href, base=None, cfg=None):
+    """Return the canonical form of ``href`` (resolved against ``base``), or None if not http(s).
+
+    Lower-cases scheme and host, drops default ports, fragments and tracking
+    parameters, sorts the remaining query, collapses repeated slashes and
+    applies the site's ``https``, ``hosts`` and ``trailing_slash`` settings.
+    """
+    cfg = cfg or {}
+    try:
+        parts = urlsplit(urljoin(base, href.strip()) if base else href.strip())
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS:
+        return None
+    if cfg.get("https", True):
+        scheme = "https"
+
+    host = (parts.hostname or "").rstrip(".")
+    if not host:
+        return None
+    hosts = cfg.get("hosts") or []
+    if hosts:
+        bare = host[4:] if host.startswith("www.") else host
+        for canonical in hosts:
+            if bare == (canonical[4:] if canonical.startswith("www.") else canonical):
+                host = canonical
+                break
+    if port and port != DEFAULT_PORTS[parts.scheme.lower()]:
+        host = f"{host}:{port}"
+
+    path = re.sub(r"/{2,}", "/", parts.path) or "/"
+    trailing = cfg.get("trailing_slash", "strip")
+    if path != "/" and trailing == "strip":
+        path = path.rstrip("/")
+    elif trailing == "add" and not path.endswith("/") and "." not in path.rsplit("/", 1)[-1]:
+        path += "/"
+
+    strip = TRACKING_PARAMS | set(cfg.get("strip_params") or [])
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in strip and not k.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+class LinkFilter:
+    """Compiled link rules for one site plus the run's de-duplication state.
+
+    ``seen`` is any container of URLs crawled on earlier runs (normally the
+    site's ``BloomFilter``); ``pending`` holds URLs discovered earlier but
+    not fetched yet. ``rejected`` counts why links were dropped: ``scheme``,
+    ``host``, ``not_included``, ``excluded``, ``duplicate`` (already found this
+    run), ``seen`` (crawled on an earlier run) or ``pending``.
+    """
+
+    def __init__(self, cfg, seen=(), pending=()):
+        self.cfg = cfg
+        self.hosts = set(cfg["hosts"])
+        self.include = _compile(cfg["include"])
+        self.exclude = _compile(cfg["exclude"])
+        self.seen = seen
+        self.pending = set(pending)
+        self.found = set()
+        self.rejected = Counter()
+        self.passed = 0
+
+    def reject(self, reason):
+        self.rejected[reason] += 1
+        return None
+
+    def check(self, href, base=None):
+        """Canonicalise ``href`` and apply the include/exclude rules, ignoring seen state."""
+        url = canonicalize(href, base, self.cfg)
+        if url is None:
+            return self.reject("scheme")
+        parts = urlsplit(url)
+        if self.hosts and parts.hostname not in self.hosts:
+            return self.reject("host")
+        target = parts.path + ("?" + parts.query if parts.query else "")
+        if self.include and not self.include.search(target):
+            return self.reject("not_included")
+        if self.exclude and self.exclude.search(target):
+            return self.reject("excluded")
+        self.passed += 1
+        return url
+
+    def admit(self, href, base=None):
+        """Return the canonical URL if it passes the rules and is new, else None."""
+        url = self.check(href, base)
+        if url is None:
+            return None
+        if url in self.found:
+            return self.reject("duplicate")
+        if url in self.seen:
+            return self.reject("seen")
+        if url in self.pending:
+            return self.reject("pending")
+        self.found.add(url)
+        return url
+
+    def summary(self):
+        return ", ".join(f"{reason}={n}" for reason, n in self.rejected.most_common()) or "none"
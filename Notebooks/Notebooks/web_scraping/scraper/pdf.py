@@ -0,0 +1,28 @@
+from textwrap import wrap
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+
+def save_text_to_pdf(title, text, filename):
+    c = canvas.Canvas(filename, pagesize=A4)
+    width, height = A4
+    margin = 50
+    y = height - margin
+
+    c.setFont("Helvetica-Bold", 14)
+    for line in wrap(title, width=80):
+        c.drawString(margin, y, line)
+        y -= 20
+    y -= 8
+
+    c.setFont("Helvetica", 11)
+    for line in wrap(text, width=90):
+        if y < 80:
+            c.showPage()
+            y = height - margin
+            c.setFont("Helvetica", 11)
+        c.drawString(margin, y, line)
+        y -= 14
+
+    c.save()
@@ -0,0 +1,195 @@
+"""Dense / BM25 / hybrid retrieval over the chunk CSV (see ``Evaluation.ipynb``).
+
+Indexes ``chunk_text`` rather than the notebook's lemmatised text so the CLI
+does not depend on NLTK.
+"""
+import csv
+import json
+import os
+import time
+from typing import List, Tuple
+
+import numpy as np
+from rank_bm25 import BM25Okapi
+
+EMBED_MODEL_NAME = "all-MiniLM-L6-v2"
+RERANKER_NAME = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+COLLECTION_NAME = "fashion_chunks"
+TOP_K = 8
+BATCH = 256
+REQUIRED_META_KEYS = ("chroma_dir", "collection_name", "chunks_csv", "embed_model")
+
+
+def load_chunks(chunks_csv):
+    texts, metadatas = [], []
+    with open(chunks_csv, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            texts.append(row["chunk_text"])
+            metadatas.append({
+                "file_name": row["file_name"],
+                "chunk_id": int(row["chunk_id"]),
+                "chunk_length": int(row["chunk_length"]),
+            })
+    ids = [f"doc_{i}" for i in range(len(texts))]
+    return texts, metadatas, ids
+
+
+def load_meta(meta_path):
+    """Read the metadata written by ``build_index``; exit if there is no usable index yet."""
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        meta = {}
+    missing = [k for k in REQUIRED_META_KEYS if k not in meta]
+    if missing:
+        raise SystemExit(f"No usable index at {meta_path} (missing {', '.join(missing)}); "
+                         f"run `scraper index` first.")
+    return meta
+
+
+def _client(chroma_dir):
+    import chromadb
+    return chromadb.PersistentClient(path=chroma_dir)
+
+
+def build_index(chunks_csv, chroma_dir, meta_path, embed_model=EMBED_MODEL_NAME, top_k=TOP_K):
+    from sentence_transformers import SentenceTransformer
+
+    texts, metadatas, ids = load_chunks(chunks_csv)
+    print("Documents:", len(texts))
+
+    embedder = SentenceTransformer(embed_model)
+    os.makedirs(chroma_dir, exist_ok=True)
+    client = _client(chroma_dir)
+    # Ids are positional (doc_<row>), so start from an empty collection or a
+    # smaller re-ingest would leave stale doc_N entries behind.
+    try:
+        client.delete_collection(COLLECTION_NAME)
+    except Exception:
+        pass
+    collection = client.create_collection(name=COLLECTION_NAME, metadata={"source": "chunks"})
+
+    for i in range(0, len(texts), BATCH):
+        emb = embedder.encode(texts[i:i + BATCH], show_progress_bar=False, normalize_embeddings=True)
+        collection.upsert(
+            ids=ids[i:i + BATCH],
+            metadatas=metadatas[i:i + BATCH],
+            documents=texts[i:i + BATCH],
+            embeddings=emb.tolist(),
+        )
+    print("Chroma DB built and persisted at:", chroma_dir)
+
+    meta = {
+        "chroma_dir": os.path.abspath(chroma_dir),
+        "collection_name": COLLECTION_NAME,
+        "chunks_csv": os.path.abspath(chunks_csv),
+        "embed_model": embed_model,
+        "reranker": RERANKER_NAME,
+        "top_k": top_k,
+    }
+    with open(meta_path, "w") as f:
+        json.dump(meta, f, indent=2)
+    print("Saved retrieval metadata to:", meta_path)
+    return meta
+
+
+def _normalize(arr):
+    arr = np.asarray(arr, dtype=float)
+    if arr.max() == arr.min():
+        return np.ones_like(arr) * 0.5
+    return (arr - arr.min()) / (arr.max() - arr.min())
+
+
+class Retriever:
+    """Loads the index described by the metadata file once and answers queries."""
+
+    def __init__(self, meta_path, rerank=False):
+        self.meta = load_meta(meta_path)
+        from sentence_transformers import SentenceTransformer
+
+        self.top_k = self.meta.get("top_k", TOP_K)
+        self.embedder = SentenceTransformer(self.meta["embed_model"])
+        self.collection = _client(self.meta["chroma_dir"]).get_collection(self.meta["collection_name"])
+        self.texts, self.metadatas, self.ids = load_chunks(self.meta["chunks_csv"])
+        self.bm25 = BM25Okapi([t.split() for t in self.texts])
+        self.reranker = None
+        if rerank and self.meta.get("reranker"):
+            from sentence_transformers import CrossEncoder
+            self.reranker = CrossEncoder(self.meta["reranker"])
+
+    def dense(self, query: str, k: int = None) -> Tuple[List[str], List[float], float]:
+        t0 = time.time()
+        q_emb = self.embedder.encode([query], normalize_embeddings=True)[0]
+        results = self.collection.query(query_embeddings=[q_emb.tolist()], n_results=k or self.top_k,
+                                        include=["distances"])
+        scores = [1.0 - d for d in results["distances"][0]]
+        return results["ids"][0], scores, time.time() - t0
+
+    def sparse(self, query: str, k: int = None) -> Tuple[List[str], List[float], float]:
+        t0 = time.time()
+        scores = self.bm25.get_scores(query.split())
+        top = np.argsort(scores)[::-1][:k or self.top_k]
+        return [self.ids[i] for i in top], [float(scores[i]) for i in top], time.time() - t0
+
+    def hybrid(self, query: str, k: int = None, alpha: float = 0.5, dense_top_m: int = 100):
+        t0 = time.time()
+        dense_ids, dense_scores, _ = self.dense(query, k=dense_top_m)
+        all_bm25 = self.bm25.get_scores(query.split())
+        bm25_scores = [float(all_bm25[int(d.split("_", 1)[1])]) for d in dense_ids]
+        fused = alpha * _normalize(dense_scores) + (1.0 - alpha) * _normalize(bm25_scores)
+        order = np.argsort(fused)[::-1][:k or self.top_k]
+        return [dense_ids[i] for i in order], [float(fused[i]) for i in order], time.time() - t0
+
+    def rerank(self, query: str, candidate_ids: List[str]):
+        t0 = time.time()
+        if self.reranker is None:
+            return candidate_ids, [None] * len(candidate_ids), 0.0
+        pairs = [(query, self.texts[int(d.split("_", 1)[1])]) for d in candidate_ids]
+        scores = self.reranker.predict(pairs)
+        order = np.argsort(scores)[::-1]
+        return [candidate_ids[i] for i in order], [float(scores[i]) for i in order], time.time() - t0
+
+    def search(self, query, mode="hybrid", k=None):
+        ids, scores, latency = getattr(self, mode)(query, k=k)
+        if self.reranker is not None:
+            ids, scores, rerank_lat = self.rerank(query, ids)
+            latency += rerank_lat
+        return ids, scores, latency
+
+    def doc(self, doc_id):
+        idx = int(doc_id.split("_", 1)[1])
+        return {"id": doc_id, "text": self.texts[idx], "metadata": self.metadatas[idx]}
+
+
+def run_query(meta_path, query, mode="hybrid", k=None, rerank=False):
+    retriever = Retriever(meta_path, rerank=rerank)
+    ids, scores, latency = retriever.search(query, mode=mode, k=k)
+    print(f"{mode} top-{len(ids)} ({latency * 1000:.1f} ms):")
+    for i, (doc_id, score) in enumerate(zip(ids, scores)):
+        info = retriever.doc(doc_id)
+        shown = f"{score:.4f}" if score is not None else "-"
+        print(i + 1, doc_id, shown, info["metadata"], info["text"][:150].replace("\n", " "))
+
+
+def run_bench(meta_path, queries, modes=("dense", "sparse", "hybrid"), repeats=5, k=None, rerank=False):
+    t0 = time.time()
+    retriever = Retriever(meta_path, rerank=rerank)
+    print(f"Index loaded in {time.time() - t0:.2f}s ({len(retriever.texts)} chunks).")
+
+    report = {}
+    for mode in modes:
+        latencies = []
+        for _ in range(repeats):
+            for q in queries:
+                latencies.append(retriever.search(q, mode=mode, k=k)[2])
+        lat = np.array(latencies) * 1000
+        report[mode] = {
+            "n": len(lat),
+            "mean_ms": float(lat.mean()),
+            "p50_ms": float(np.percentile(lat, 50)),
+            "p95_ms": float(np.percentile(lat, 95)),
+        }
+        print(f"{mode:>7}: n={len(lat)} mean={lat.mean():.1f}ms "
+              f"p50={np.percentile(lat, 50):.1f}ms p95={np.percentile(lat, 95):.1f}ms")
+    return report
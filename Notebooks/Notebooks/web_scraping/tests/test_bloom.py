@@ -0,0 +1,51 @@
+import pytest
+
+from scraper.bloom import BloomFilter
+
+
+def test_membership_and_add_reports_new():
+    b = BloomFilter(1000)
+    assert b.add("https://a.lk/1")
+    assert not b.add("https://a.lk/1")
+    assert "https://a.lk/1" in b
+    assert "https://a.lk/2" not in b
+    assert len(b) == 1
+
+
+def test_false_positive_rate_near_target():
+    b = BloomFilter(5000, error_rate=1e-3)
+    for i in range(5000):
+        b.add(f"https://x/{i}")
+    fp = sum(f"https://y/{i}" in b for i in range(20000)) / 20000
+    assert fp < 5e-3
+    assert not b.full
+    b.add("one more")
+    assert b.full
+
+
+def test_save_load_roundtrip(tmp_path):
+    b = BloomFilter(1000)
+    for i in range(100):
+        b.add(f"u{i}")
+    path = str(tmp_path / "seen.bloom")
+    b.save(path)
+    loaded = BloomFilter.load(path)
+    assert all(f"u{i}" in loaded for i in range(100))
+    assert loaded.count == 100 and loaded.capacity == 1000
+
+
+@pytest.mark.parametrize("cut", [5, -10])
+def test_load_rejects_truncated_file(tmp_path, cut):
+    path = str(tmp_path / "seen.bloom")
+    BloomFilter(1000).save(path)
+    data = open(path, "rb").read()
+    open(path, "wb").write(data[:cut])
+    with pytest.raises(ValueError):
+        BloomFilter.load(path)
+
+
+def test_load_rejects_foreign_file(tmp_path):
+    path = tmp_path / "seen.bloom"
+    path.write_bytes(b"x" * 100)
+    with pytest.raises(ValueError):
+        BloomFilter.load(str(path))
@@ -0,0 +1,47 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from scraper.config import DEFAULTS, _merge, load_site, load_sites, site_paths
+
+
+def test_merge_is_deep_and_does_not_mutate_defaults():
+    merged = _merge(DEFAULTS, {"goto": {"timeout_ms": 1}, "delay_secs": 3})
+    assert merged["goto"]["timeout_ms"] == 1
+    assert merged["goto"]["wait_until"] == DEFAULTS["goto"]["wait_until"]
+    assert merged["delay_secs"] == 3
+    assert DEFAULTS["goto"]["timeout_ms"] == 120000
+    merged["extract"]["block_tags"].append("li")
+    assert DEFAULTS["extract"]["block_tags"] == ["p"]
+
+
+def test_load_site_fills_names_and_lists_replace(tmp_path):
+    path = tmp_path / "demo.json"
+    path.write_text(json.dumps({"extract": {"block_tags": ["li"]}}))
+    site = load_site(str(path))
+    assert site["name"] == "demo"
+    assert site["out_dir"] == "demo_articles"
+    assert site["file_prefix"] == "demo_article"
+    assert site["extract"]["block_tags"] == ["li"]
+    assert site["extract"]["min_text_len"] == DEFAULTS["extract"]["min_text_len"]
+
+
+def test_bundled_sites_load_and_unknown_site_errors():
+    assert {s["name"] for s in load_sites()} == {"akira", "hi", "life", "thesun", "weekendfashionista"}
+    with pytest.raises(FileNotFoundError):
+        site_paths(["nope"])
+
+
+def test_cli_and_retrieval_do_not_import_browser_or_pdf_stack():
+    pytest.importorskip("numpy")
+    pytest.importorskip("rank_bm25")
+    code = (
+        "import sys, scraper.cli, scraper.retrieval, scraper.config\n"
+        "bad = {'playwright', 'bs4', 'reportlab'} & {m.split('.')[0] for m in sys.modules}\n"
+        "assert not bad, bad\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True,
+                   cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from scraper import crawl, discover
+from scraper.config import DEFAULTS, _merge
+
+
+class Interrupted(BaseException):
+    """Stands in for Ctrl-C / a killed process in the middle of a crawl."""
+
+
+class FakeContext:
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    async def new_context(self):
+        return FakeContext()
+
+
+def crawl_site_cfg(tmp_path):
+    return _merge(DEFAULTS, {
+        "name": "l", "out_dir": str(tmp_path), "delay_secs": 0, "concurrency": 1,
+        "listing": {"urls": ["https://x.lk/list/"], "page_url": "{url}page/{n}/", "max_pages": None},
+        "discovery": {"robots": False, "sitemaps": [], "feeds": [], "lookahead": 4},
+        "links": {"hosts": ["x.lk"], "include": ["^/a/"]},
+    })
+
+
+@pytest.fixture
+def listing_of_20(monkeypatch):
+    async def links(context, url, site):
+        n = int(url.rstrip("/").rsplit("/", 1)[-1]) if "/page/" in url else 1
+        return [f"/a/{n}"] if n <= 20 else []
+
+    monkeypatch.setattr(discover, "_listing_links", links)
+
+
+def fake_fetch(monkeypatch, interrupt_after=None, failing=()):
+    fetched = []
+
+    async def fetch_html(context, http, url, site):
+        if url in failing:
+            raise RuntimeError("boom")
+        if interrupt_after is not None and len(fetched) >= interrupt_after:
+            raise Interrupted()
+        fetched.append(url)
+        return f"<html>{url}</html>"
+
+    monkeypatch.setattr(crawl, "fetch_html", fetch_html)
+    return fetched
+
+
+def run(site):
+    return asyncio.run(crawl.crawl_site(FakeBrowser(), None, site))
+
+
+def manifest_urls(tmp_path):
+    with open(tmp_path / "crawl.jsonl", encoding="utf-8") as f:
+        return [json.loads(line)["url"] for line in f]
+
+
+def test_interrupted_crawl_resumes_from_todo(tmp_path, monkeypatch, listing_of_20):
+    site = crawl_site_cfg(tmp_path)
+    fake_fetch(monkeypatch, interrupt_after=5)
+    with pytest.raises(Interrupted):
+        run(site)
+    assert len(manifest_urls(tmp_path)) == 5
+    with open(tmp_path / "todo.jsonl", encoding="utf-8") as f:
+        assert len(f.readlines()) == 15
+
+    # Discovery stops at the first listing window (all known), the todo file supplies the rest.
+    fetched = fake_fetch(monkeypatch)
+    assert run(site) == 15
+    assert sorted(manifest_urls(tmp_path)) == sorted(f"https://x.lk/a/{n}" for n in range(1, 21))
+    assert len(fetched) == 15
+    assert not os.path.exists(tmp_path / "todo.jsonl")
+
+    fetched = fake_fetch(monkeypatch)
+    assert run(site) == 0
+    assert fetched == []
+
+
+def test_failed_fetches_are_retried_up_to_max_attempts(tmp_path, monkeypatch, listing_of_20):
+    site = crawl_site_cfg(tmp_path)
+    bad = "https://x.lk/a/3"
+    todo_path = tmp_path / "todo.jsonl"
+    for attempt in range(1, crawl.MAX_ATTEMPTS):
+        fake_fetch(monkeypatch, failing={bad})
+        run(site)
+        assert [json.loads(line) for line in open(todo_path)] == [{"url": bad, "attempts": attempt}]
+    fake_fetch(monkeypatch, failing={bad})
+    run(site)
+    assert not os.path.exists(todo_path)
+    assert bad not in manifest_urls(tmp_path)
+    assert len(manifest_urls(tmp_path)) == 19
@@ -0,0 +1,220 @@
+import asyncio
+import gzip
+import tracemalloc
+
+from scraper import discover
+from scraper.config import DEFAULTS, _merge
+from scraper.discover import _origin, discover_links, harvest_sitemaps, iter_xml_links, paginate_listing
+from scraper.links import LinkFilter
+
+SITEMAP_NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def test_urlset_gzip_and_large():
+    body = (f"<urlset {SITEMAP_NS}>"
+            + "".join(f"<url><loc> https://a.lk/p{i} </loc><lastmod>2024</lastmod></url>" for i in range(5000))
+            + "</urlset>").encode()
+    for data in (body, gzip.compress(body)):
+        links = list(iter_xml_links(data))
+        assert len(links) == 5000
+        assert links[0] == ("page", "https://a.lk/p0")
+
+
+def test_parsed_entries_are_released():
+    def peak(n):
+        body = (f"<urlset {SITEMAP_NS}>"
+                + "".join(f"<url><loc>https://a.lk/p{i}</loc></url>" for i in range(n))
+                + "</urlset>").encode()
+        tracemalloc.start()
+        for _ in iter_xml_links(body):
+            pass
+        size = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return size
+
+    # Memory must not grow with the number of entries once they are read.
+    assert peak(40000) < 2 * peak(4000)
+
+
+def test_sitemap_index():
+    body = f"<sitemapindex {SITEMAP_NS}><sitemap><loc>https://a.lk/post-sitemap.xml</loc></sitemap></sitemapindex>"
+    assert list(iter_xml_links(body.encode())) == [("sitemap", "https://a.lk/post-sitemap.xml")]
+
+
+def test_rss_items_only():
+    body = (b"<rss><channel><link>https://a.lk</link>"
+            b"<item><title>x</title><link>https://a.lk/x</link></item></channel></rss>")
+    assert list(iter_xml_links(body)) == [("page", "https://a.lk/x")]
+
+
+def test_atom_alternate_links_only():
+    body = (b'<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+            b'<link href="https://a.lk/y"/><link rel="replies" href="https://a.lk/y#c"/></entry>'
+            b'<entry><link/><link href=" "/></entry></feed>')
+    assert list(iter_xml_links(body)) == [("page", "https://a.lk/y")]
+
+
+def test_malformed_documents_yield_nothing():
+    assert list(iter_xml_links(b"<html><body>not xml")) == []
+    assert list(iter_xml_links(b"\x1f\x8bnot really gzip")) == []
+
+
+def seed_only_site(**links):
+    return _merge(DEFAULTS, {"name": "s", "articles": [
+        "https://www.thesun.lk/a/1?utm_source=x",
+        "https://www.thesun.lk/a/1",
+        "https://other.lk/a/2",
+        "https://www.thesun.lk/a/3",
+    ], "links": {"hosts": ["www.thesun.lk"], **links}})
+
+
+def test_seed_only_site_has_no_origin():
+    assert _origin(seed_only_site()) is None
+
+
+def test_seeds_go_through_link_filter(capsys):
+    site = seed_only_site()
+    links = asyncio.run(discover_links(None, None, site, {"https://www.thesun.lk/a/3"}))
+    assert links == ["https://www.thesun.lk/a/1"]
+    out = capsys.readouterr().out
+    for reason in ("duplicate=1", "host=1", "seen=1"):
+        assert reason in out
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.ok = body is not None
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakeHttp:
+    def __init__(self, docs):
+        self.docs = docs
+        self.requested = []
+
+    async def get(self, url, timeout=None, fail_on_status_code=True):
+        self.requested.append(url)
+        return FakeResponse(self.docs.get(url))
+
+
+def urlset(*urls):
+    return (f"<urlset {SITEMAP_NS}>" + "".join(f"<url><loc>{u}</loc></url>" for u in urls) + "</urlset>").encode()
+
+
+def sitemapindex(*urls):
+    return (f"<sitemapindex {SITEMAP_NS}>" + "".join(f"<sitemap><loc>{u}</loc></sitemap>" for u in urls)
+            + "</sitemapindex>").encode()
+
+
+def sitemap_site(**discovery):
+    return _merge(DEFAULTS, {"name": "s", "discovery": discovery,
+                             "listing": {"urls": ["https://a.lk/blog/"]}})
+
+
+def test_harvest_sitemaps_follows_indexes_and_sitemap_include():
+    http = FakeHttp({
+        "https://a.lk/robots.txt": b"User-agent: *\nSitemap: https://a.lk/sitemap_index.xml\n"
+                                   b"Sitemap: https://a.lk/product-sitemap.xml\n",
+        "https://a.lk/sitemap_index.xml": sitemapindex("https://a.lk/post-sitemap.xml",
+                                                       "https://a.lk/page-sitemap.xml"),
+        "https://a.lk/post-sitemap.xml": urlset("https://a.lk/blog/one/", "https://a.lk/blog/two/"),
+        "https://a.lk/page-sitemap.xml": urlset("https://a.lk/cart/"),
+        "https://a.lk/product-sitemap.xml": urlset("https://a.lk/product/shoe/"),
+    })
+    site = sitemap_site(sitemap_include=["post-sitemap"])
+    pages = asyncio.run(harvest_sitemaps(http, site, "https://a.lk"))
+    assert pages == ["https://a.lk/blog/one/", "https://a.lk/blog/two/"]
+    assert "https://a.lk/page-sitemap.xml" not in http.requested
+
+
+def test_harvest_sitemaps_falls_back_to_configured_locations():
+    http = FakeHttp({"https://a.lk/sitemap.xml": urlset("https://a.lk/blog/one/")})
+    pages = asyncio.run(harvest_sitemaps(http, sitemap_site(), "https://a.lk"))
+    assert pages == ["https://a.lk/blog/one/"]
+    assert http.requested == ["https://a.lk/robots.txt", "https://a.lk/sitemap.xml"]
+
+
+def listing_site(max_pages=None, lookahead=3, cap=200):
+    return _merge(DEFAULTS, {
+        "name": "l",
+        "listing": {"urls": ["https://x.lk/list/"], "page_url": "{url}page/{n}/", "max_pages": max_pages},
+        "discovery": {"robots": False, "sitemaps": [], "feeds": [], "lookahead": lookahead,
+                      "max_listing_pages": cap},
+        "links": {"hosts": ["x.lk"], "include": ["^/a/"]},
+    })
+
+
+def fake_listing(monkeypatch, pages):
+    """Serve ``pages(n)`` as the links of listing page ``n`` and record what was rendered."""
+    rendered = []
+
+    async def links(context, url, site):
+        n = int(url.rstrip("/").rsplit("/", 1)[-1]) if "/page/" in url else 1
+        rendered.append(n)
+        return ["/list/", "/about/"] + [f"/a/{u}" for u in pages(n)]
+
+    monkeypatch.setattr(discover, "_listing_links", links)
+    return rendered
+
+
+def run_paginate(site, seen=()):
+    return asyncio.run(paginate_listing(None, site, LinkFilter(site["links"], seen)))
+
+
+def test_paginate_stops_at_page_without_matching_links(monkeypatch):
+    rendered = fake_listing(monkeypatch, lambda n: [f"{n}-{j}" for j in range(3)] if n <= 5 else [])
+    links = run_paginate(listing_site())
+    assert len(links) == 15
+    assert rendered == [1, 2, 3, 4, 5, 6]
+
+
+def test_paginate_stops_when_page_repeats_previous(monkeypatch):
+    # Past the last page the site keeps serving the last page's links.
+    rendered = fake_listing(monkeypatch, lambda n: [f"{min(n, 4)}-{j}" for j in range(3)])
+    links = run_paginate(listing_site())
+    assert len(links) == 12
+    assert rendered == [1, 2, 3, 4, 5, 6]
+
+
+def test_paginate_stops_at_window_of_known_urls(monkeypatch):
+    rendered = fake_listing(monkeypatch, lambda n: [f"{n}"])
+    seen = {f"https://x.lk/a/{n}" for n in range(3, 100)}
+    links = run_paginate(listing_site(lookahead=2), seen)
+    assert links == ["https://x.lk/a/1", "https://x.lk/a/2"]
+    assert rendered == [1, 2, 3, 4]
+
+
+def test_paginate_is_capped_when_every_page_has_fresh_links(monkeypatch):
+    rendered = fake_listing(monkeypatch, lambda n: [f"{n}"])
+    assert len(run_paginate(listing_site(cap=10))) == 10
+    assert max(rendered) == 10
+
+    rendered.clear()
+    assert len(run_paginate(listing_site(max_pages=7, cap=10))) == 7
+    assert max(rendered) == 7
+
+
+def test_listing_without_page_url_renders_only_first_page(monkeypatch):
+    rendered = fake_listing(monkeypatch, lambda n: [f"{n}"])
+    site = listing_site()
+    site["listing"]["page_url"] = None
+    assert run_paginate(site) == ["https://x.lk/a/1"]
+    assert rendered == [1]
+
+
+def test_discover_falls_back_to_listing_without_sitemap_articles(monkeypatch):
+    rendered = fake_listing(monkeypatch, lambda n: [f"{n}"] if n <= 2 else [])
+    site = listing_site()
+    site["discovery"]["sitemaps"] = ["{origin}/sitemap.xml"]
+    http = FakeHttp({"https://x.lk/sitemap.xml": urlset("https://x.lk/about/")})
+    links = asyncio.run(discover_links(None, http, site, set(), pending={"https://x.lk/a/2"}))
+    assert links == ["https://x.lk/a/1"]
+    assert rendered == [1, 2, 3]
+
+    http = FakeHttp({"https://x.lk/sitemap.xml": urlset("https://x.lk/a/9")})
+    rendered.clear()
+    assert asyncio.run(discover_links(None, http, site, set())) == ["https://x.lk/a/9"]
+    assert rendered == []
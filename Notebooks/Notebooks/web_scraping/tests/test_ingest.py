@@ -0,0 +1,21 @@
+import pytest
+
+from scraper.cli import main
+from scraper.ingest import chunk_text
+
+
+def test_chunks_overlap():
+    chunks = chunk_text("abcdefghij", chunk_size=4, overlap=1)
+    assert chunks == ["abcd", "defg", "ghij", "j"]
+
+
+def test_chunk_text_rejects_overlap_not_smaller_than_size():
+    with pytest.raises(ValueError):
+        chunk_text("abc", chunk_size=4, overlap=4)
+
+
+def test_cli_rejects_overlap_not_smaller_than_chunk_size(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["ingest", "--chunk-size", "50", "--overlap", "50"])
+    assert exc.value.code == 2
+    assert "--overlap" in capsys.readouterr().err
@@ -0,0 +1,87 @@
+import pytest
+
+from scraper.config import DEFAULTS, load_sites
+from scraper.links import LinkFilter, canonicalize
+
+
+def links_cfg(**overrides):
+    return {**DEFAULTS["links"], **overrides}
+
+
+def test_canonicalize_resolves_and_normalises():
+    cfg = links_cfg(hosts=["www.hi.lk"])
+    base = "https://www.hi.lk/45/fashion--beauty"
+    assert canonicalize("/article/1-foo?utm_source=x&b=2&a=1#top", base, cfg) == \
+        "https://www.hi.lk/article/1-foo?a=1&b=2"
+    assert canonicalize("http://HI.lk:80//article/9/", cfg=cfg) == "https://www.hi.lk/article/9"
+    assert canonicalize("https://www.hi.lk:8443/x", cfg=cfg) == "https://www.hi.lk:8443/x"
+
+
+def test_canonicalize_rejects_non_http_and_malformed():
+    for href in ["mailto:a@b.lk", "whatsapp://send?text=x", "javascript:void(0)", "http://[bad"]:
+        assert canonicalize(href) is None
+
+
+def test_canonicalize_trailing_slash_modes():
+    assert canonicalize("https://akira.lk/post", cfg=links_cfg(trailing_slash="add")) == "https://akira.lk/post/"
+    assert canonicalize("https://akira.lk/a.pdf", cfg=links_cfg(trailing_slash="add")) == "https://akira.lk/a.pdf"
+    assert canonicalize("https://akira.lk/post/", cfg=links_cfg(trailing_slash="keep")) == "https://akira.lk/post/"
+    assert canonicalize("https://akira.lk/", cfg=links_cfg()) == "https://akira.lk/"
+
+
+def test_canonicalize_strips_configured_params():
+    cfg = links_cfg(strip_params=["sessionid"])
+    assert canonicalize("https://a.lk/p?sessionid=1&id=2&fbclid=3", cfg=cfg) == "https://a.lk/p?id=2"
+
+
+def test_link_filter_rules_and_reasons():
+    cfg = links_cfg(hosts=["akira.lk"], trailing_slash="add", exclude=["^/author/", "/share"])
+    f = LinkFilter(cfg, seen={"https://akira.lk/old/"})
+    base = "https://akira.lk/blog/"
+    assert f.admit("/new-post?fbclid=1", base) == "https://akira.lk/new-post/"
+    assert f.admit("https://www.akira.lk/new-post/#c", base) is None
+    assert f.admit("/old", base) is None
+    assert f.admit("/author/x", base) is None
+    assert f.admit("https://pinterest.com/pin/create/?u=1", base) is None
+    assert f.admit("whatsapp://send", base) is None
+    assert f.rejected == {"duplicate": 1, "seen": 1, "excluded": 1, "host": 1, "scheme": 1}
+    assert f.passed == 3
+
+
+def test_link_filter_include_matches_path_and_query():
+    f = LinkFilter(links_cfg(include=["^/article/", "[?&]id=\\d+"]))
+    assert f.admit("https://www.hi.lk/article/1")
+    assert f.admit("https://www.hi.lk/view?id=7")
+    assert f.admit("https://www.hi.lk/news/1") is None
+    assert f.rejected["not_included"] == 1
+
+
+SITE_LINKS = {
+    "akira": (
+        ["https://akira.lk/blog/summer-trends/"],
+        ["https://akira.lk/", "https://akira.lk/blog/", "https://akira.lk/blog/page/2/",
+         "https://akira.lk/product/linen-dress/", "https://akira.lk/cart/",
+         "https://akira.lk/blog/category/style/", "https://akira.lk/author/admin/"],
+    ),
+    "hi": (
+        ["https://www.hi.lk/article/12345-red-carpet-looks"],
+        ["https://www.hi.lk/45/fashion--beauty", "https://www.hi.lk/45/fashion--beauty?page=2",
+         "https://www.hi.lk/tag/fashion", "https://www.hi.lk/news/1"],
+    ),
+    "life": (
+        ["https://www.life.lk/article/fashion/9876/monsoon-wardrobe"],
+        ["https://www.life.lk/54/fashion/60", "https://www.life.lk/54/fashion/72",
+         "https://www.life.lk/tag/fashion", "https://www.life.lk/"],
+    ),
+}
+
+
+@pytest.mark.parametrize("name", sorted(SITE_LINKS))
+def test_site_rules_admit_only_articles(name):
+    site = load_sites([name])[0]
+    articles, others = SITE_LINKS[name]
+    f = LinkFilter(site["links"])
+    for url in articles:
+        assert f.admit(url) == url
+    for url in others:
+        assert f.admit(url) is None, url